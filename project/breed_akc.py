@@ -1,13 +1,21 @@
 import json
 import os
 import re
+import tempfile
+import threading
 import time
-from typing import Dict, Optional, Set
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Set
 from urllib.parse import urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
 
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process coalescing only
+    fcntl = None
+
 # Cache paths
 BREED_LIST_CACHE = "breed_list_cache.json"
 BREED_CONTENT_CACHE_DIR = "breed_content_cache"
@@ -28,6 +36,90 @@ EXCLUDED_SLUGS = {
 }
 
 
+class _InFlight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+# One in-flight fetch per cache key, shared by every thread in this process
+_inflight: Dict[str, _InFlight] = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(key: str, fn: Callable[[], Any]) -> Any:
+    with _inflight_lock:
+        call = _inflight.get(key)
+        leader = call is None
+        if leader:
+            call = _InFlight()
+            _inflight[key] = call
+
+    if not leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    try:
+        call.result = fn()
+        return call.result
+    except BaseException as e:
+        call.error = e
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        call.done.set()
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    # Serializes fetches for the same cache file across processes
+    if fcntl is None:
+        yield
+        return
+
+    with open(f"{path}.lock", "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _read_json_cache(path: str) -> Optional[Any]:
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
+
+
+def _write_json_atomic(path: str, data: Any) -> None:
+    # Write to a temp file in the same directory, then rename over the target,
+    # so readers never see a truncated cache file
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def _is_valid_breed_url(href: str) -> bool:
     if not href or "/dog-breeds/" not in href:
         return False
@@ -137,21 +229,27 @@ def _scrape_all_breed_pages() -> Dict[str, Dict[str, str]]:
     return breed_map
 
 
-def get_breed_list() -> Dict[str, Dict[str, str]]:
-    if os.path.exists(BREED_LIST_CACHE):
-        try:
-            with open(BREED_LIST_CACHE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            pass
+def _load_or_scrape_breed_list() -> Dict[str, Dict[str, str]]:
+    with _file_lock(BREED_LIST_CACHE):
+        # Another process may have finished the crawl while we waited
+        cached = _read_json_cache(BREED_LIST_CACHE)
+        if cached is not None:
+            return cached
 
-    breed_map = _scrape_all_breed_pages()
+        breed_map = _scrape_all_breed_pages()
 
-    if breed_map:
-        with open(BREED_LIST_CACHE, "w", encoding="utf-8") as f:
-            json.dump(breed_map, f, indent=2, ensure_ascii=False)
+        if breed_map:
+            _write_json_atomic(BREED_LIST_CACHE, breed_map)
 
-    return breed_map
+        return breed_map
+
+
+def get_breed_list() -> Dict[str, Dict[str, str]]:
+    cached = _read_json_cache(BREED_LIST_CACHE)
+    if cached is not None:
+        return cached
+
+    return _single_flight("breed_list", _load_or_scrape_breed_list)
 
 
 def get_breed_full_profile(breed_name: str) -> Optional[Dict]:
@@ -166,13 +264,26 @@ def get_breed_full_profile(breed_name: str) -> Optional[Dict]:
         BREED_CONTENT_CACHE_DIR, f"{breed_name}_profile.json"
     )
 
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            pass
+    cached = _read_json_cache(cache_file)
+    if cached is not None:
+        return cached
+
+    return _single_flight(
+        f"profile:{breed_name}",
+        lambda: _load_or_scrape_profile(breed_info, cache_file),
+    )
+
+
+def _load_or_scrape_profile(breed_info: Dict[str, str], cache_file: str) -> Optional[Dict]:
+    with _file_lock(cache_file):
+        cached = _read_json_cache(cache_file)
+        if cached is not None:
+            return cached
+
+        return _scrape_breed_profile(breed_info, cache_file)
+
 
+def _scrape_breed_profile(breed_info: Dict[str, str], cache_file: str) -> Optional[Dict]:
     headers = {"User-Agent": USER_AGENT}
 
     try:
@@ -210,8 +321,7 @@ def get_breed_full_profile(breed_name: str) -> Optional[Dict]:
             "scraped_at": time.strftime("%Y-%m-%d %H:%M:%S"),
         }
 
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(profile, f, indent=2, ensure_ascii=False)
+        _write_json_atomic(cache_file, profile)
 
         return profile
 